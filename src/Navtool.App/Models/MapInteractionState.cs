@@ -62,10 +62,12 @@ public sealed class MapInteractionState
 
 public readonly record struct ScreenPoint(double X, double Y)
 {
-    public double DistanceTo(ScreenPoint other)
+    public double DistanceTo(ScreenPoint other) => Math.Sqrt(DistanceSquaredTo(other));
+
+    public double DistanceSquaredTo(ScreenPoint other)
     {
         var deltaX = X - other.X;
         var deltaY = Y - other.Y;
-        return Math.Sqrt((deltaX * deltaX) + (deltaY * deltaY));
+        return (deltaX * deltaX) + (deltaY * deltaY);
     }
 }
@@ -152,7 +152,7 @@ public static class RouteHitTester
                     continue;
                 }
 
-                var pointIndex = click.DistanceTo(route.Points[index - 1]) <= click.DistanceTo(route.Points[index])
+                var pointIndex = click.DistanceSquaredTo(route.Points[index - 1]) <= click.DistanceSquaredTo(route.Points[index])
                     ? index - 1
                     : index;
                 nearest = CreateSelection(route.Route, pointIndex, RouteHitKind.Route, distance);
@@ -226,7 +226,7 @@ public static class RouteHitTester
                     continue;
                 }
 
-                var pointIndex = click.DistanceTo(leg.Points[index - 1]) <= click.DistanceTo(leg.Points[index])
+                var pointIndex = click.DistanceSquaredTo(leg.Points[index - 1]) <= click.DistanceSquaredTo(leg.Points[index])
                     ? index - 1
                     : index;
                 nearest = new RouteMapSelection(
@@ -130,10 +130,19 @@ public readonly record struct GeographicBounds
             throw new ArgumentException("At least one coordinate is required.", nameof(coordinates));
         }
 
-        var longitudes = points
-            .Select(point => point.Longitude < 0 ? point.Longitude + 360 : point.Longitude)
-            .Order()
-            .ToArray();
+        // One pass gathers the latitude extent and the 0..360 longitudes together.
+        var south = double.PositiveInfinity;
+        var north = double.NegativeInfinity;
+        var longitudes = new double[points.Length];
+        for (var index = 0; index < points.Length; index++)
+        {
+            var point = points[index];
+            south = Math.Min(south, point.Latitude);
+            north = Math.Max(north, point.Latitude);
+            longitudes[index] = point.Longitude < 0 ? point.Longitude + 360 : point.Longitude;
+        }
+
+        Array.Sort(longitudes);
 
         var largestGap = -1d;
         var gapIndex = 0;
@@ -151,8 +160,8 @@ public readonly record struct GeographicBounds
         var west360 = longitudes[(gapIndex + 1) % longitudes.Length];
         var east360 = longitudes[gapIndex];
         return new GeographicBounds(
-            points.Min(point => point.Latitude),
-            points.Max(point => point.Latitude),
+            south,
+            north,
             ToSignedLongitude(west360),
             ToSignedLongitude(east360));
     }
@@ -178,6 +178,8 @@ public sealed class NativeForecast : IDisposable
 
 public sealed class NativeRouterBridge
 {
+    private static readonly UTF8Encoding StrictUtf8 = new(false, true);
+
     private readonly NativeRouterBridgeOptions _options;
     private readonly NativeRouterCapabilities _capabilities;
     private int _streamingProgressAvailability;
@@ -906,12 +908,12 @@ public sealed class NativeRouterBridge
             latticeSearch);
     }
 
-    private ImmutableArray<T> CopyArray<T>(
+    private unsafe ImmutableArray<T> CopyArray<T>(
         IntPtr pointer,
         ulong count,
         string description,
         bool allowEmpty = false)
-        where T : struct
+        where T : unmanaged
     {
         if (count == 0)
         {
@@ -935,16 +937,11 @@ public sealed class NativeRouterBridge
                 $"Native progress {description} had a null pointer.");
         }
 
-        var length = checked((int)count);
-        var itemSize = Marshal.SizeOf<T>();
-        var builder = ImmutableArray.CreateBuilder<T>(length);
-        for (var index = 0; index < length; index++)
-        {
-            builder.Add(Marshal.PtrToStructure<T>(
-                IntPtr.Add(pointer, checked(index * itemSize))));
-        }
-
-        return builder.MoveToImmutable();
+        // Progress element structs are blittable, so their managed and native
+        // layouts agree and the native block is copied once, straight into the
+        // array the immutable result wraps.
+        var values = new ReadOnlySpan<T>((void*)pointer, checked((int)count)).ToArray();
+        return ImmutableCollectionsMarshal.AsImmutableArray(values);
     }
 
     public ImmutableArray<ViewportWindSample> SampleViewport(
@@ -1096,7 +1093,7 @@ public sealed class NativeRouterBridge
         Marshal.Copy(pointer, bytes, 0, bytes.Length);
         try
         {
-            return new UTF8Encoding(false, true).GetString(bytes);
+            return StrictUtf8.GetString(bytes);
         }
         catch (DecoderFallbackException exception)
         {
@@ -2427,32 +2424,55 @@ internal sealed class NativeEnvironmentScope : IDisposable
             return default;
         }
 
-        var vertices = new List<NativeCoordinate>();
-        var holes = new List<NativeExclusionRing>();
-        var polygons = new List<NativeExclusionPolygon>();
-        var zones = new List<NativeExclusionZone>(exclusions.Zones.Count);
+        // Count the flattened buffers first so each is filled in place at its
+        // final size and pinned as is, without list growth or a copy to an array.
+        var polygonCount = 0;
+        var holeCount = 0;
+        var vertexCount = 0;
+        foreach (var zone in exclusions.Zones)
+        {
+            foreach (var polygon in zone.Polygons)
+            {
+                polygonCount++;
+                holeCount += polygon.Holes.Count;
+                vertexCount += polygon.Outer.Vertices.Count;
+                foreach (var hole in polygon.Holes)
+                {
+                    vertexCount += hole.Vertices.Count;
+                }
+            }
+        }
+
+        var zones = new NativeExclusionZone[exclusions.Zones.Count];
+        var polygons = new NativeExclusionPolygon[polygonCount];
+        var holes = new NativeExclusionRing[holeCount];
+        var vertices = new NativeCoordinate[vertexCount];
+        var zoneIndex = 0;
+        var polygonIndex = 0;
+        var holeIndex = 0;
+        var vertexIndex = 0;
 
         foreach (var zone in exclusions.Zones)
         {
-            var polygonOffset = (ulong)polygons.Count;
+            var polygonOffset = (ulong)polygonIndex;
             foreach (var polygon in zone.Polygons)
             {
-                var outer = AppendRing(polygon.Outer, vertices);
-                var holeOffset = (ulong)holes.Count;
+                var outer = AppendRing(polygon.Outer, vertices, ref vertexIndex);
+                var holeOffset = (ulong)holeIndex;
                 foreach (var hole in polygon.Holes)
                 {
-                    holes.Add(AppendRing(hole, vertices));
+                    holes[holeIndex++] = AppendRing(hole, vertices, ref vertexIndex);
                 }
 
-                polygons.Add(new NativeExclusionPolygon
+                polygons[polygonIndex++] = new NativeExclusionPolygon
                 {
                     Outer = outer,
                     HoleOffset = holeOffset,
                     HoleCount = (ulong)polygon.Holes.Count
-                });
+                };
             }
 
-            zones.Add(new NativeExclusionZone
+            zones[zoneIndex++] = new NativeExclusionZone
             {
                 Identifier = AllocateUtf8(zone.Identifier),
                 Source = AllocateUtf8(zone.Source),
@@ -2465,7 +2485,7 @@ internal sealed class NativeEnvironmentScope : IDisposable
                 HasActiveUntil = zone.ActiveUntil is null ? (byte)0 : (byte)1,
                 PolygonOffset = polygonOffset,
                 PolygonCount = (ulong)zone.Polygons.Count
-            });
+            };
         }
 
         return new NativeExclusionSettings
@@ -2473,29 +2493,30 @@ internal sealed class NativeEnvironmentScope : IDisposable
             Configured = 1,
             BoundaryPolicy = (int)exclusions.BoundaryPolicy,
             Zones = AllocateArray(zones),
-            ZoneCount = (ulong)zones.Count,
+            ZoneCount = (ulong)zones.Length,
             Polygons = AllocateArray(polygons),
-            PolygonCount = (ulong)polygons.Count,
+            PolygonCount = (ulong)polygons.Length,
             Holes = AllocateArray(holes),
-            HoleCount = (ulong)holes.Count,
+            HoleCount = (ulong)holes.Length,
             Vertices = AllocateArray(vertices),
-            VertexCount = (ulong)vertices.Count,
+            VertexCount = (ulong)vertices.Length,
             Metadata = AllocateMetadata(exclusions.Metadata)
         };
     }
 
     private static NativeExclusionRing AppendRing(
         RouteExclusionRing ring,
-        List<NativeCoordinate> vertices)
+        NativeCoordinate[] vertices,
+        ref int vertexIndex)
     {
-        var offset = (ulong)vertices.Count;
+        var offset = (ulong)vertexIndex;
         foreach (var vertex in ring.Vertices)
         {
-            vertices.Add(new NativeCoordinate
+            vertices[vertexIndex++] = new NativeCoordinate
             {
                 LatitudeDegrees = vertex.Latitude,
                 LongitudeDegrees = vertex.Longitude
-            });
+            };
         }
 
         return new NativeExclusionRing
@@ -2525,15 +2546,15 @@ internal sealed class NativeEnvironmentScope : IDisposable
         return Pin(buffer);
     }
 
-    private IntPtr AllocateArray<T>(List<T> values)
+    private IntPtr AllocateArray<T>(T[] values)
         where T : struct
     {
-        if (values.Count == 0)
+        if (values.Length == 0)
         {
             return IntPtr.Zero;
         }
 
-        return Pin(values.ToArray());
+        return Pin(values);
     }
 
     private IntPtr Pin(Array buffer)
@@ -36,8 +36,7 @@ public sealed class NaturalEarthLandDataProvider : ILandDataProvider
         using var compressed = new GZipStream(
             resource,
             CompressionMode.Decompress);
-        using var reader = new StreamReader(compressed);
-        var payload = GeoJsonLandParser.Parse(reader.ReadToEnd());
+        var payload = GeoJsonLandParser.Parse(compressed);
         return new LandDataAcquisition(
             LandDataStatus.Available,
             new LandGeometryIndex(payload.Geometries),
@@ -813,7 +813,8 @@ public sealed class NoaaGfsForecastProvider : IForecastProvider, IForecastDownlo
             .ConfigureAwait(false);
         var buffer = new byte[128 * 1024];
         var first = new byte[4];
-        var tail = new Queue<byte>(4);
+        var tail = new byte[4];
+        var tailLength = 0;
         long total = 0;
         while (true)
         {
@@ -828,35 +829,47 @@ public sealed class NoaaGfsForecastProvider : IForecastProvider, IForecastDownlo
                 throw new ForecastDownloadException($"NOAA NOMADS response for '{uri}' exceeds the configured size limit.");
             }
 
-            for (var index = 0; index < read; index++)
+            // Only the framing bytes matter, so copy the head and tail slices of
+            // each chunk rather than visiting every byte of a 128 KiB read.
+            if (total < first.Length)
             {
-                if (total + index < 4)
-                {
-                    first[total + index] = buffer[index];
-                }
-
-                if (tail.Count == 4)
-                {
-                    tail.Dequeue();
-                }
-
-                tail.Enqueue(buffer[index]);
+                var headLength = (int)Math.Min(first.Length - total, read);
+                buffer.AsSpan(0, headLength).CopyTo(first.AsSpan((int)total));
             }
 
+            tailLength = AppendTail(tail, tailLength, buffer.AsSpan(0, read));
             await destination.WriteAsync(buffer.AsMemory(0, read), cancellationToken).ConfigureAwait(false);
             total += read;
         }
 
         if (total < 8 ||
             !first.AsSpan().SequenceEqual("GRIB"u8) ||
-            tail.Count != 4 ||
-            !tail.ToArray().AsSpan().SequenceEqual("7777"u8))
+            tailLength != tail.Length ||
+            !tail.AsSpan().SequenceEqual("7777"u8))
         {
             throw new ForecastDownloadException(
                 $"NOAA NOMADS response for '{uri}' is not a complete GRIB artifact.");
         }
     }
 
+    /// <summary>
+    /// Keeps the last <c>tail.Length</c> bytes seen so far in <paramref name="tail"/>
+    /// and returns how many of them are valid.
+    /// </summary>
+    private static int AppendTail(byte[] tail, int tailLength, ReadOnlySpan<byte> chunk)
+    {
+        if (chunk.Length >= tail.Length)
+        {
+            chunk[^tail.Length..].CopyTo(tail);
+            return tail.Length;
+        }
+
+        var kept = Math.Min(tailLength, tail.Length - chunk.Length);
+        tail.AsSpan(tailLength - kept, kept).CopyTo(tail);
+        chunk.CopyTo(tail.AsSpan(kept));
+        return kept + chunk.Length;
+    }
+
     private TimeSpan GetRetryDelay(Exception exception, int completedAttempts)
     {
         if (exception is TransientForecastDownloadException { RetryAfter: { } retryAfter })
@@ -1,5 +1,7 @@
 using System.Collections.Concurrent;
 using System.Globalization;
+using System.Net;
+using System.Net.Http.Headers;
 using System.Security.Cryptography;
 using System.Text;
 using System.Text.Json;
@@ -267,30 +269,61 @@ public sealed class OsmLandDataProvider : ILandDataProvider
                 : DateTimeOffset.MinValue;
             if (diskExpiresAt > now)
             {
-                if (new FileInfo(cachePath).Length > _options.MaximumResponseBytes)
-                {
-                    File.Delete(cachePath);
-                    throw new InvalidDataException(
-                        $"Cached land response exceeds {_options.MaximumResponseBytes:N0} bytes.");
-                }
-
-                var cachedJson = await File.ReadAllTextAsync(cachePath, cancellationToken)
+                return await ReadDiskCacheAsync(key, cachePath, diskExpiresAt, cancellationToken)
                     .ConfigureAwait(false);
-                var cachedPayload = GeoJsonLandParser.Parse(cachedJson);
-                var cached = new CachedPayload(
-                    cachedPayload,
-                    diskExpiresAt);
-                _memoryCache[key] = cached;
-                EnforceMemoryLimit(_memoryCache);
-                return cached;
             }
 
-            var requestUri = BuildRequestUri(_options.Endpoint!, bounds);
-            using var response = await _httpClient.GetAsync(
-                    requestUri,
+            var validatorsPath = ValidatorsPath(cachePath);
+            var validators = diskExpiresAt == DateTimeOffset.MinValue
+                ? null
+                : await ReadValidatorsAsync(validatorsPath, cancellationToken).ConfigureAwait(false);
+            using var request = new HttpRequestMessage(
+                HttpMethod.Get,
+                BuildRequestUri(_options.Endpoint!, bounds));
+
+            // An expired corridor is revalidated only with the validators the service
+            // supplied. The service compares If-Modified-Since against its own clock,
+            // so a locally measured time could hide a land change behind a 304.
+            if (validators?.ETag is { } etag &&
+                EntityTagHeaderValue.TryParse(etag, out var entityTag))
+            {
+                request.Headers.IfNoneMatch.Add(entityTag);
+            }
+
+            if (validators?.LastModified is { } lastModified)
+            {
+                request.Headers.IfModifiedSince = lastModified;
+            }
+
+            using var response = await _httpClient.SendAsync(
+                    request,
                     HttpCompletionOption.ResponseHeadersRead,
                     cancellationToken)
                 .ConfigureAwait(false);
+            if (response.StatusCode == HttpStatusCode.NotModified &&
+                (request.Headers.IfNoneMatch.Count > 0 ||
+                 request.Headers.IfModifiedSince is not null))
+            {
+                // The write time only drives expiry, so touching the file starts a new
+                // freshness window for the revalidated corridor.
+                File.SetLastWriteTimeUtc(cachePath, now.UtcDateTime);
+                var refreshed = new CacheValidators(
+                    response.Headers.ETag?.ToString() ?? validators!.ETag,
+                    response.Content.Headers.LastModified ?? validators!.LastModified);
+                if (refreshed != validators)
+                {
+                    await StoreValidatorsAsync(validatorsPath, refreshed, cancellationToken)
+                        .ConfigureAwait(false);
+                }
+
+                return await ReadDiskCacheAsync(
+                        key,
+                        cachePath,
+                        now + _options.CacheDuration,
+                        cancellationToken)
+                    .ConfigureAwait(false);
+            }
+
             response.EnsureSuccessStatusCode();
             if (response.Content.Headers.ContentLength is > 0 &&
                 response.Content.Headers.ContentLength > _options.MaximumResponseBytes)
@@ -304,10 +337,22 @@ public sealed class OsmLandDataProvider : ILandDataProvider
             var json = await ReadBoundedAsync(
                     input,
                     _options.MaximumResponseBytes,
+                    response.Content.Headers.ContentLength,
                     cancellationToken)
                 .ConfigureAwait(false);
             var payload = GeoJsonLandParser.Parse(json);
+
+            // Stale validators are dropped before the new body lands, so a failure
+            // between the two writes can only cost an unconditional download.
+            File.Delete(validatorsPath);
             await StoreAtomicallyAsync(cachePath, json, cancellationToken).ConfigureAwait(false);
+            await StoreValidatorsAsync(
+                    validatorsPath,
+                    new CacheValidators(
+                        response.Headers.ETag?.ToString(),
+                        response.Content.Headers.LastModified),
+                    cancellationToken)
+                .ConfigureAwait(false);
             PruneDiskCache(now, cachePath);
             var downloaded = new CachedPayload(payload, now + _options.CacheDuration);
             _memoryCache[key] = downloaded;
@@ -320,6 +365,73 @@ public sealed class OsmLandDataProvider : ILandDataProvider
         }
     }
 
+    private async Task<CachedPayload> ReadDiskCacheAsync(
+        string key,
+        string cachePath,
+        DateTimeOffset expiresAt,
+        CancellationToken cancellationToken)
+    {
+        if (new FileInfo(cachePath).Length > _options.MaximumResponseBytes)
+        {
+            File.Delete(cachePath);
+            File.Delete(ValidatorsPath(cachePath));
+            throw new InvalidDataException(
+                $"Cached land response exceeds {_options.MaximumResponseBytes:N0} bytes.");
+        }
+
+        var cachedJson = await File.ReadAllBytesAsync(cachePath, cancellationToken)
+            .ConfigureAwait(false);
+        var cached = new CachedPayload(GeoJsonLandParser.Parse(cachedJson), expiresAt);
+        _memoryCache[key] = cached;
+        EnforceMemoryLimit(_memoryCache);
+        return cached;
+    }
+
+    private static string ValidatorsPath(string cachePath) =>
+        Path.ChangeExtension(cachePath, ".validators.json");
+
+    private static async Task<CacheValidators?> ReadValidatorsAsync(
+        string path,
+        CancellationToken cancellationToken)
+    {
+        if (!File.Exists(path))
+        {
+            return null;
+        }
+
+        try
+        {
+            await using var input = File.OpenRead(path);
+            return await JsonSerializer.DeserializeAsync<CacheValidators>(
+                    input,
+                    cancellationToken: cancellationToken)
+                .ConfigureAwait(false);
+        }
+        catch (JsonException)
+        {
+            // Unreadable validators only cost an unconditional download.
+            return null;
+        }
+    }
+
+    private static async Task StoreValidatorsAsync(
+        string path,
+        CacheValidators validators,
+        CancellationToken cancellationToken)
+    {
+        if (validators.ETag is null && validators.LastModified is null)
+        {
+            File.Delete(path);
+            return;
+        }
+
+        await StoreAtomicallyAsync(
+                path,
+                JsonSerializer.SerializeToUtf8Bytes(validators),
+                cancellationToken)
+            .ConfigureAwait(false);
+    }
+
     private static IEnumerable<GeographicBounds> SplitAtAntimeridian(
         GeographicBounds bounds)
     {
@@ -360,12 +472,16 @@ public sealed class OsmLandDataProvider : ILandDataProvider
                    .ToLowerInvariant();
     }
 
-    private static async Task<string> ReadBoundedAsync(
+    private static async Task<ReadOnlyMemory<byte>> ReadBoundedAsync(
         Stream input,
         long maximumBytes,
+        long? expectedBytes,
         CancellationToken cancellationToken)
     {
-        using var output = new MemoryStream();
+        // Sizing the buffer from Content-Length avoids regrowing and copying it
+        // repeatedly while a multi-megabyte corridor streams in.
+        using var output = new MemoryStream(
+            (int)Math.Clamp(expectedBytes ?? 0, 0, Math.Min(maximumBytes, int.MaxValue)));
         var buffer = new byte[64 * 1024];
         while (true)
         {
@@ -384,19 +500,30 @@ public sealed class OsmLandDataProvider : ILandDataProvider
             output.Write(buffer, 0, read);
         }
 
-        return Encoding.UTF8.GetString(output.GetBuffer(), 0, checked((int)output.Length));
+        // The parser and the disk cache both work on UTF-8, so the response is
+        // never transcoded to a UTF-16 string on its way through.
+        return output.GetBuffer().AsMemory(0, checked((int)output.Length));
     }
 
     private static async Task StoreAtomicallyAsync(
         string path,
-        string content,
+        ReadOnlyMemory<byte> content,
         CancellationToken cancellationToken)
     {
         var temporary = path + "." + Guid.NewGuid().ToString("N") + ".partial";
         try
         {
-            await File.WriteAllTextAsync(temporary, content, Encoding.UTF8, cancellationToken)
-                .ConfigureAwait(false);
+            await using (var output = new FileStream(
+                             temporary,
+                             FileMode.CreateNew,
+                             FileAccess.Write,
+                             FileShare.None,
+                             64 * 1024,
+                             FileOptions.Asynchronous))
+            {
+                await output.WriteAsync(content, cancellationToken).ConfigureAwait(false);
+            }
+
             File.Move(temporary, path, true);
         }
         finally
@@ -424,10 +551,14 @@ public sealed class OsmLandDataProvider : ILandDataProvider
             .EnumerateFiles(_options.CacheDirectory, "*.geojson", SearchOption.TopDirectoryOnly)
             .Select(path => new FileInfo(path))
             .ToList();
+
+        // An expired corridor with service validators can still be revalidated for
+        // the cost of a 304, so it is kept until the size bounds need the room.
         foreach (var entry in entries.Where(entry =>
                      new DateTimeOffset(entry.LastWriteTimeUtc, TimeSpan.Zero) +
                          _options.CacheDuration <= now &&
-                     !string.Equals(entry.FullName, protectedPath, StringComparison.Ordinal)))
+                     !string.Equals(entry.FullName, protectedPath, StringComparison.Ordinal) &&
+                     !File.Exists(ValidatorsPath(entry.FullName))))
         {
             entry.Delete();
         }
@@ -448,13 +579,29 @@ public sealed class OsmLandDataProvider : ILandDataProvider
             }
 
             entry.Delete();
+            File.Delete(ValidatorsPath(entry.FullName));
             count--;
             bytes -= entry.Length;
         }
 
+        foreach (var orphan in Directory
+                     .EnumerateFiles(
+                         _options.CacheDirectory,
+                         "*.validators.json",
+                         SearchOption.TopDirectoryOnly)
+                     .Where(path =>
+                         !File.Exists(Path.ChangeExtension(
+                             Path.ChangeExtension(path, null),
+                             ".geojson")))
+                     .ToList())
+        {
+            File.Delete(orphan);
+        }
+
         if (count > _options.MaximumCacheEntries || bytes > _options.MaximumCacheBytes)
         {
             File.Delete(protectedPath);
+            File.Delete(ValidatorsPath(protectedPath));
             throw new IOException("The land response exceeds the configured cache bounds.");
         }
     }
@@ -478,6 +625,8 @@ public sealed class OsmLandDataProvider : ILandDataProvider
     private sealed record CachedPayload(LandPayload Payload, DateTimeOffset ExpiresAt)
         : IExpiringCacheEntry;
 
+    private sealed record CacheValidators(string? ETag, DateTimeOffset? LastModified);
+
     private sealed record CachedAcquisition(
         LandDataAcquisition Acquisition,
         DateTimeOffset ExpiresAt)
@@ -683,11 +832,28 @@ internal static class GeoJsonLandParser
     private static readonly GeometryFactory GeometryFactory =
         NetTopologySuite.NtsGeometryServices.Instance.CreateGeometryFactory(srid: 4326);
 
-    public static LandPayload Parse(string json)
+    public static LandPayload Parse(ReadOnlyMemory<byte> utf8Json)
+    {
+        // Cache files written by earlier releases start with a byte order mark,
+        // which the UTF-8 reader rejects.
+        if (utf8Json.Span.StartsWith(Encoding.UTF8.Preamble))
+        {
+            utf8Json = utf8Json[Encoding.UTF8.Preamble.Length..];
+        }
+
+        using var document = JsonDocument.Parse(utf8Json);
+        return Read(document.RootElement);
+    }
+
+    public static LandPayload Parse(Stream utf8Json)
+    {
+        ArgumentNullException.ThrowIfNull(utf8Json);
+        using var document = JsonDocument.Parse(utf8Json);
+        return Read(document.RootElement);
+    }
+
+    private static LandPayload Read(JsonElement root)
     {
-        ArgumentException.ThrowIfNullOrWhiteSpace(json);
-        using var document = JsonDocument.Parse(json);
-        var root = document.RootElement;
         var attribution = root.TryGetProperty("attribution", out var attributionElement) &&
                           attributionElement.ValueKind == JsonValueKind.String
             ? attributionElement.GetString()
@@ -751,13 +917,13 @@ internal static class GeoJsonLandParser
         enumerator.MoveNext();
         var shell = ReadRing(enumerator.Current, null);
         var shellCenter = shell.EnvelopeInternal.Centre.X;
-        var holes = new List<LinearRing>();
-        while (enumerator.MoveNext())
+        var holes = new LinearRing[coordinates.GetArrayLength() - 1];
+        for (var index = 0; enumerator.MoveNext(); index++)
         {
-            holes.Add(ReadRing(enumerator.Current, shellCenter));
+            holes[index] = ReadRing(enumerator.Current, shellCenter);
         }
 
-        var polygon = GeometryFactory.CreatePolygon(shell, holes.ToArray());
+        var polygon = GeometryFactory.CreatePolygon(shell, holes);
         if (!polygon.IsValid || polygon.IsEmpty)
         {
             throw new InvalidDataException("A land polygon is empty or topologically invalid.");
@@ -773,19 +939,29 @@ internal static class GeoJsonLandParser
             throw new InvalidDataException("A land polygon ring requires at least four positions.");
         }
 
-        var rawCoordinates = ring.EnumerateArray().Select(ReadPosition).ToList();
-        if (!rawCoordinates[0].Equals2D(rawCoordinates[^1]))
+        // Positions are read once into the array the ring will own and unwrapped
+        // in place, rather than rebuilt through intermediate lists.
+        var coordinates = new NtsCoordinate[ring.GetArrayLength()];
+        var count = 0;
+        foreach (var position in ring.EnumerateArray())
+        {
+            coordinates[count++] = ReadPosition(position);
+        }
+
+        if (!coordinates[0].Equals2D(coordinates[^1]))
         {
             throw new InvalidDataException("A GeoJSON polygon ring must be closed.");
         }
 
-        rawCoordinates.RemoveAt(rawCoordinates.Count - 1);
-        var coordinates = new List<NtsCoordinate>(rawCoordinates.Count + 1);
-        var previousLongitude = rawCoordinates[0].X;
-        coordinates.Add(rawCoordinates[0].Copy());
-        foreach (var raw in rawCoordinates.Skip(1))
+        // The closing position is replaced by a copy of the unwrapped first one,
+        // so only the open ring is adjusted.
+        var openCount = coordinates.Length - 1;
+        var previousLongitude = coordinates[0].X;
+        var longitudeSum = previousLongitude;
+        for (var index = 1; index < openCount; index++)
         {
-            var longitude = raw.X;
+            var coordinate = coordinates[index];
+            var longitude = coordinate.X;
             while (longitude - previousLongitude > 180)
             {
                 longitude -= 360;
@@ -796,22 +972,23 @@ internal static class GeoJsonLandParser
                 longitude += 360;
             }
 
-            coordinates.Add(new NtsCoordinate(longitude, raw.Y));
+            coordinate.X = longitude;
             previousLongitude = longitude;
+            longitudeSum += longitude;
         }
 
         if (referenceLongitude is { } reference)
         {
-            var center = coordinates.Average(coordinate => coordinate.X);
+            var center = longitudeSum / openCount;
             var offset = Math.Round((reference - center) / 360) * 360;
-            foreach (var coordinate in coordinates)
+            for (var index = 0; index < openCount; index++)
             {
-                coordinate.X += offset;
+                coordinates[index].X += offset;
             }
         }
 
-        coordinates.Add(coordinates[0].Copy());
-        return GeometryFactory.CreateLinearRing(coordinates.ToArray());
+        coordinates[^1] = coordinates[0].Copy();
+        return GeometryFactory.CreateLinearRing(coordinates);
     }
 
     private static NtsCoordinate ReadPosition(JsonElement position)
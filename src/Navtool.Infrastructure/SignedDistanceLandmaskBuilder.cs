@@ -1,3 +1,4 @@
+using System.Runtime.ExceptionServices;
 using Navtool.Core;
 using NetTopologySuite.Geometries;
 using NetTopologySuite.Index.Strtree;
@@ -22,7 +23,8 @@ namespace Navtool.Infrastructure;
 /// reported distances are never larger than the true distance. Under-reporting
 /// only makes segment certification more cautious; it can never round a
 /// decision toward accepting land. The sign comes from a separate point-in-
-/// polygon test on the unscaled geometry, so it stays exact everywhere.
+/// polygon test on the unscaled geometry, so it stays exact everywhere; that
+/// test only runs where the scaled distance is already zero or nearly so.
 /// </para>
 /// </remarks>
 public static class SignedDistanceLandmaskBuilder
@@ -157,6 +159,7 @@ public static class SignedDistanceLandmaskBuilder
         double resolutionNauticalMiles,
         CancellationToken cancellationToken)
     {
+        cancellationToken.ThrowIfCancellationRequested();
         var factory = NetTopologySuite.NtsGeometryServices.Instance
             .CreateGeometryFactory(srid: 4326);
 
@@ -190,31 +193,69 @@ public static class SignedDistanceLandmaskBuilder
 
         var distance = new GeometryItemDistance();
         var samples = new double[grid.SampleCount];
-        for (var row = 0; row < grid.LatitudeCount; row++)
-        {
-            cancellationToken.ThrowIfCancellationRequested();
-            var latitude = grid.SouthLatitudeDegrees + (row * grid.LatitudeStepDegrees);
-            for (var column = 0; column < grid.LongitudeCount; column++)
+
+        // Every node is an independent nearest-neighbour and point-in-polygon
+        // query against indexes that are only read once built, so rows can be
+        // filled on all cores. Each row writes a disjoint slice of the samples.
+        ForEachRow(
+            grid.LatitudeCount,
+            cancellationToken,
+            row =>
             {
-                var longitude =
-                    grid.WestLongitudeDegrees + (column * grid.LongitudeStepDegrees);
-                samples[(row * grid.LongitudeCount) + column] = empty
-                    ? MaximumReportedDistanceNauticalMiles
-                    : SignedDistance(
-                        geometry,
-                        scaled,
-                        distance,
-                        factory,
-                        latitude,
-                        longitude,
-                        latitudeCosine,
-                        resolutionNauticalMiles);
-            }
-        }
+                var latitude = grid.SouthLatitudeDegrees + (row * grid.LatitudeStepDegrees);
+                var rowOffset = row * grid.LongitudeCount;
+                for (var column = 0; column < grid.LongitudeCount; column++)
+                {
+                    var longitude =
+                        grid.WestLongitudeDegrees + (column * grid.LongitudeStepDegrees);
+                    samples[rowOffset + column] = empty
+                        ? MaximumReportedDistanceNauticalMiles
+                        : SignedDistance(
+                            geometry,
+                            scaled,
+                            distance,
+                            factory,
+                            latitude,
+                            longitude,
+                            latitudeCosine,
+                            resolutionNauticalMiles);
+                }
+            });
 
         return samples;
     }
 
+    /// <summary>
+    /// Runs <paramref name="body"/> for every row on the thread pool while keeping
+    /// the exception contract of a sequential loop.
+    /// </summary>
+    internal static void ForEachRow(
+        int rowCount,
+        CancellationToken cancellationToken,
+        Action<int> body)
+    {
+        try
+        {
+            // The build blocks route preparation on the shared thread pool, so it
+            // is capped at one worker per core rather than letting the pool grow.
+            Parallel.For(
+                0,
+                rowCount,
+                new ParallelOptions
+                {
+                    CancellationToken = cancellationToken,
+                    MaxDegreeOfParallelism = Environment.ProcessorCount
+                },
+                body);
+        }
+        catch (AggregateException exception)
+        {
+            // Callers of Build see the fault a row raised, as they did before the
+            // rows ran in parallel, rather than the loop's wrapper.
+            ExceptionDispatchInfo.Capture(exception.InnerExceptions[0]).Throw();
+        }
+    }
+
     private static double SignedDistance(
         LandGeometryIndex geometry,
         STRtree<Geometry> scaled,
@@ -240,9 +281,15 @@ public static class SignedDistanceLandmaskBuilder
         // A node exactly on the coastline reads zero, which would let a
         // transition graze land. Bias it inland by a fraction of a cell so the
         // interpolated field crosses zero on the water side of the coast.
-        if (IsLand(geometry, latitude, longitude))
+        var coastBias = resolutionNauticalMiles * 1e-3;
+
+        // Distance to a polygon is zero anywhere inside it, and scaling longitude
+        // preserves containment, so a node measurably clear of every scaled
+        // polygon is water. Only nodes on or hugging the coast need the exact
+        // point-in-polygon test, which keeps it off the open-water majority.
+        if (magnitude <= coastBias && IsLand(geometry, latitude, longitude))
         {
-            return -Math.Max(magnitude, resolutionNauticalMiles * 1e-3);
+            return -Math.Max(magnitude, coastBias);
         }
 
         return magnitude;
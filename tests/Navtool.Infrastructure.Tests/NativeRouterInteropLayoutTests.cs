@@ -1,3 +1,4 @@
+using System.Runtime.CompilerServices;
 using System.Runtime.InteropServices;
 using Navtool.Core;
 using Navtool.Infrastructure;
@@ -42,6 +43,17 @@ public sealed class NativeRouterInteropLayoutTests
         Assert.Equal(480, Marshal.OffsetOf<NativeEnvironment>(nameof(NativeEnvironment.Exclusions)).ToInt32());
     }
 
+    [Fact]
+    public void Progress_element_structs_are_blittable_for_bulk_copy()
+    {
+        // Progress arrays are copied as raw bytes, which is only sound while the
+        // managed layout of each element matches its marshaled layout.
+        Assert.Equal(Marshal.SizeOf<NativeCoordinate>(), Unsafe.SizeOf<NativeCoordinate>());
+        Assert.Equal(Marshal.SizeOf<NativeRoutePoint>(), Unsafe.SizeOf<NativeRoutePoint>());
+        Assert.Equal(Marshal.SizeOf<NativeContourSegment>(), Unsafe.SizeOf<NativeContourSegment>());
+        Assert.Equal(Marshal.SizeOf<NativeFrontSegment>(), Unsafe.SizeOf<NativeFrontSegment>());
+    }
+
     [Fact]
     public void Supported_abi_version_is_seven()
     {
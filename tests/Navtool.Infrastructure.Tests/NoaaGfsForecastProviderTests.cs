@@ -178,6 +178,50 @@ public sealed class NoaaGfsForecastProviderTests
         Assert.Empty(Directory.EnumerateFiles(directory.Path));
     }
 
+    [Fact]
+    public async Task Download_accepts_grib_markers_split_across_short_reads()
+    {
+        using var directory = new TestDirectory();
+        var payload = "GRIBpayload7777"u8.ToArray();
+        var handler = new RecordingHttpHandler((_, _, _) =>
+            Task.FromResult(TricklingGribResponse(payload)));
+        using var client = new HttpClient(handler);
+        var provider = CreateProvider(directory.Path, client);
+        await using var destination = new MemoryStream();
+
+        await provider.DownloadGribWithRetryAsync(
+            new Uri("https://example.test/noaa.grib2"),
+            destination,
+            CancellationToken.None);
+
+        Assert.Equal(payload, destination.ToArray());
+        Assert.Equal(1, handler.RequestCount);
+    }
+
+    [Theory]
+    [InlineData("GRIBpayload")]
+    [InlineData("GRIBpayload777")]
+    [InlineData("GRIBpayload7787")]
+    [InlineData("GRI7777")]
+    public async Task Download_rejects_incomplete_grib_framing_across_short_reads(string content)
+    {
+        using var directory = new TestDirectory();
+        var handler = new RecordingHttpHandler((_, _, _) =>
+            Task.FromResult(TricklingGribResponse(System.Text.Encoding.ASCII.GetBytes(content))));
+        using var client = new HttpClient(handler);
+        var provider = CreateProvider(directory.Path, client);
+        await using var destination = new MemoryStream();
+
+        var exception = await Assert.ThrowsAsync<ForecastDownloadException>(async () =>
+            await provider.DownloadGribWithRetryAsync(
+                new Uri("https://example.test/noaa.grib2"),
+                destination,
+                CancellationToken.None));
+
+        Assert.Contains("not a complete GRIB artifact", exception.Message, StringComparison.Ordinal);
+        Assert.Equal(1, handler.RequestCount);
+    }
+
     [Fact]
     public async Task Download_with_retry_rejects_non_seekable_destination_before_http()
     {
@@ -767,11 +811,59 @@ public sealed class NoaaGfsForecastProviderTests
             new DateTimeOffset(2026, 7, 14, 8, 0, 0, TimeSpan.Zero),
             new DateTimeOffset(2026, 7, 14, 10, 0, 0, TimeSpan.Zero));
 
+    private static HttpResponseMessage TricklingGribResponse(byte[] payload)
+    {
+        var response = new HttpResponseMessage(HttpStatusCode.OK)
+        {
+            Content = new StreamContent(new TricklingMemoryStream(payload))
+        };
+        response.Content.Headers.ContentType =
+            new System.Net.Http.Headers.MediaTypeHeaderValue("application/octet-stream");
+        return response;
+    }
+
     private sealed class SynchronousProgress<T>(Action<T> action) : IProgress<T>
     {
         public void Report(T value) => action(value);
     }
 
+    /// <summary>
+    /// Returns reads of one to three bytes in rotation so framing markers land
+    /// across read boundaries.
+    /// </summary>
+    private sealed class TricklingMemoryStream(byte[] payload) : MemoryStream(payload, writable: false)
+    {
+        private int _reads;
+
+        public override int Read(byte[] buffer, int offset, int count) =>
+            base.Read(buffer, offset, NextCount(count));
+
+        // Stream's span and async reads route back through Read(byte[], ...), so
+        // each override caps the size once and delegates to the array overload.
+        public override int Read(Span<byte> buffer)
+        {
+            var chunk = new byte[NextCount(buffer.Length)];
+            var read = base.Read(chunk, 0, chunk.Length);
+            chunk.AsSpan(0, read).CopyTo(buffer);
+            return read;
+        }
+
+        public override Task<int> ReadAsync(
+            byte[] buffer,
+            int offset,
+            int count,
+            CancellationToken cancellationToken) =>
+            Task.FromResult(Read(buffer, offset, count));
+
+        public override ValueTask<int> ReadAsync(
+            Memory<byte> buffer,
+            CancellationToken cancellationToken = default) =>
+            ValueTask.FromResult(Read(buffer.Span));
+
+        private int NextCount(int requested) =>
+            Math.Min(requested, (_reads++ % 3) + 1);
+    }
+
     private sealed class NonSeekableMemoryStream : MemoryStream
     {
         public override bool CanSeek => false;
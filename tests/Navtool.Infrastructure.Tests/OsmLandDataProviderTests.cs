@@ -1,4 +1,5 @@
 using System.Net;
+using System.Net.Http.Headers;
 using System.Text;
 using Navtool.Core;
 using Navtool.Infrastructure;
@@ -189,6 +190,224 @@ public sealed class OsmLandDataProviderTests
         Assert.Equal(1, secondHandler.RequestCount);
     }
 
+    [Fact]
+    public async Task Expired_disk_cache_is_revalidated_with_the_service_validators()
+    {
+        using var directory = new TestDirectory();
+        var createdAt = new DateTimeOffset(2026, 7, 1, 0, 0, 0, TimeSpan.Zero);
+        var serverModifiedAt = createdAt.AddDays(-2);
+        var firstHandler = new RecordingHttpHandler((_, _, _) =>
+        {
+            var response = GeoJsonResponse(LandGeoJson);
+            response.Headers.ETag = new EntityTagHeaderValue("\"land-1\"");
+            response.Content.Headers.LastModified = serverModifiedAt;
+            return Task.FromResult(response);
+        });
+        var first = new OsmLandDataProvider(
+            new HttpClient(firstHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(createdAt));
+        var bounds = new GeographicBounds(-10, 10, -10, 10);
+        Assert.Equal(LandDataStatus.Available, (await first.AcquireAsync(bounds)).Status);
+
+        var cachePath = Assert.Single(Directory.EnumerateFiles(directory.Path, "*.geojson"));
+        File.SetLastWriteTimeUtc(cachePath, createdAt.UtcDateTime);
+        var revalidatedAt = createdAt.AddDays(8);
+        DateTimeOffset? ifModifiedSince = null;
+        var ifNoneMatch = new List<EntityTagHeaderValue>();
+        var secondHandler = new RecordingHttpHandler((request, _, _) =>
+        {
+            ifModifiedSince = request.Headers.IfModifiedSince;
+            ifNoneMatch.AddRange(request.Headers.IfNoneMatch);
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.NotModified));
+        });
+        var second = new OsmLandDataProvider(
+            new HttpClient(secondHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(revalidatedAt));
+
+        var result = await second.AcquireAsync(bounds);
+
+        Assert.Equal(LandDataStatus.Available, result.Status);
+        Assert.True(result.Geometry!.Contains(new Coordinate(0, 0)));
+        Assert.Equal(serverModifiedAt, ifModifiedSince);
+        Assert.Equal("\"land-1\"", Assert.Single(ifNoneMatch).Tag);
+        Assert.Equal(revalidatedAt.UtcDateTime, File.GetLastWriteTimeUtc(cachePath));
+        Assert.Equal(1, secondHandler.RequestCount);
+    }
+
+    [Fact]
+    public async Task Expired_disk_cache_without_service_validators_is_downloaded_unconditionally()
+    {
+        using var directory = new TestDirectory();
+        var createdAt = new DateTimeOffset(2026, 7, 1, 0, 0, 0, TimeSpan.Zero);
+        var firstHandler = new RecordingHttpHandler((_, _, _) =>
+            Task.FromResult(GeoJsonResponse(LandGeoJson)));
+        var first = new OsmLandDataProvider(
+            new HttpClient(firstHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(createdAt));
+        var bounds = new GeographicBounds(-10, 10, -10, 10);
+        Assert.Equal(LandDataStatus.Available, (await first.AcquireAsync(bounds)).Status);
+
+        var cachePath = Assert.Single(Directory.EnumerateFiles(directory.Path, "*.geojson"));
+        File.SetLastWriteTimeUtc(cachePath, createdAt.UtcDateTime);
+        var conditional = false;
+        var secondHandler = new RecordingHttpHandler((request, _, _) =>
+        {
+            conditional = request.Headers.IfModifiedSince is not null ||
+                          request.Headers.IfNoneMatch.Count > 0;
+            return Task.FromResult(GeoJsonResponse(LandGeoJson));
+        });
+        var second = new OsmLandDataProvider(
+            new HttpClient(secondHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(createdAt.AddDays(8)));
+
+        Assert.Equal(LandDataStatus.Available, (await second.AcquireAsync(bounds)).Status);
+        Assert.False(conditional, "A response without Last-Modified or ETag must not be revalidated.");
+        Assert.Equal(1, secondHandler.RequestCount);
+    }
+
+    [Fact]
+    public async Task Expired_antimeridian_halves_are_each_revalidated_with_their_validators()
+    {
+        using var directory = new TestDirectory();
+        var createdAt = new DateTimeOffset(2026, 7, 1, 0, 0, 0, TimeSpan.Zero);
+        var firstHandler = new RecordingHttpHandler((request, _, _) =>
+        {
+            var response = GeoJsonResponse("""{"type":"FeatureCollection","features":[]}""");
+            response.Headers.ETag = new EntityTagHeaderValue(
+                request.RequestUri!.Query.Contains("west=170", StringComparison.Ordinal)
+                    ? "\"west-half\""
+                    : "\"east-half\"");
+            return Task.FromResult(response);
+        });
+        var first = new OsmLandDataProvider(
+            new HttpClient(firstHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(createdAt));
+        var bounds = new GeographicBounds(-10, 10, 170, -170);
+        Assert.Equal(LandDataStatus.Available, (await first.AcquireAsync(bounds)).Status);
+
+        foreach (var cachePath in Directory.EnumerateFiles(directory.Path, "*.geojson"))
+        {
+            File.SetLastWriteTimeUtc(cachePath, createdAt.UtcDateTime);
+        }
+
+        var ifNoneMatch = new List<string>();
+        var secondHandler = new RecordingHttpHandler((request, _, _) =>
+        {
+            lock (ifNoneMatch)
+            {
+                ifNoneMatch.AddRange(request.Headers.IfNoneMatch.Select(tag => tag.Tag));
+            }
+
+            return Task.FromResult(new HttpResponseMessage(HttpStatusCode.NotModified));
+        });
+        var second = new OsmLandDataProvider(
+            new HttpClient(secondHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path),
+            new FixedTimeProvider(createdAt.AddDays(8)));
+
+        Assert.Equal(LandDataStatus.Available, (await second.AcquireAsync(bounds)).Status);
+        Assert.Equal(2, secondHandler.RequestCount);
+        Assert.Equal(["\"east-half\"", "\"west-half\""], ifNoneMatch.Order(StringComparer.Ordinal));
+        Assert.Equal(2, Directory.EnumerateFiles(directory.Path, "*.geojson").Count());
+        Assert.Equal(2, Directory.EnumerateFiles(directory.Path, "*.validators.json").Count());
+    }
+
+    [Fact]
+    public async Task Full_response_replaces_the_stored_validators()
+    {
+        using var directory = new TestDirectory();
+        var createdAt = new DateTimeOffset(2026, 7, 1, 0, 0, 0, TimeSpan.Zero);
+        var bounds = new GeographicBounds(-10, 10, -10, 10);
+        var options = new OsmLandDataOptions(
+            new Uri("https://land.example.test/geometry"),
+            directory.Path);
+        var ifNoneMatch = new List<string>();
+        var etag = "\"land-1\"";
+        var handler = new RecordingHttpHandler((request, _, _) =>
+        {
+            ifNoneMatch.AddRange(request.Headers.IfNoneMatch.Select(tag => tag.Tag));
+            var response = GeoJsonResponse(LandGeoJson);
+            response.Headers.ETag = new EntityTagHeaderValue(etag);
+            return Task.FromResult(response);
+        });
+
+        for (var day = 0; day <= 16; day += 8)
+        {
+            var provider = new OsmLandDataProvider(
+                new HttpClient(handler),
+                options,
+                new FixedTimeProvider(createdAt.AddDays(day)));
+            Assert.Equal(LandDataStatus.Available, (await provider.AcquireAsync(bounds)).Status);
+            var cachePath = Assert.Single(Directory.EnumerateFiles(directory.Path, "*.geojson"));
+            File.SetLastWriteTimeUtc(cachePath, createdAt.AddDays(day).UtcDateTime);
+            etag = "\"land-2\"";
+        }
+
+        Assert.Equal(3, handler.RequestCount);
+        Assert.Equal(["\"land-1\"", "\"land-2\""], ifNoneMatch);
+    }
+
+    [Fact]
+    public async Task Validators_without_a_cached_corridor_are_swept()
+    {
+        using var directory = new TestDirectory();
+        var handler = new RecordingHttpHandler((_, _, _) =>
+        {
+            var response = GeoJsonResponse(LandGeoJson);
+            response.Headers.ETag = new EntityTagHeaderValue("\"land-1\"");
+            return Task.FromResult(response);
+        });
+        var provider = new OsmLandDataProvider(
+            new HttpClient(handler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path));
+        Assert.Equal(
+            LandDataStatus.Available,
+            (await provider.AcquireAsync(new GeographicBounds(-10, 10, -10, 10))).Status);
+        var orphaned = Assert.Single(Directory.EnumerateFiles(directory.Path, "*.validators.json"));
+        File.Delete(Path.ChangeExtension(Path.ChangeExtension(orphaned, null), ".geojson"));
+
+        Assert.Equal(
+            LandDataStatus.Available,
+            (await provider.AcquireAsync(new GeographicBounds(-20, 20, -20, 20))).Status);
+
+        Assert.False(File.Exists(orphaned));
+        Assert.Single(Directory.EnumerateFiles(directory.Path, "*.validators.json"));
+    }
+
+    [Fact]
+    public async Task Disk_cache_written_with_a_byte_order_mark_is_still_readable()
+    {
+        using var directory = new TestDirectory();
+        var firstHandler = new RecordingHttpHandler((_, _, _) =>
+            Task.FromResult(GeoJsonResponse(LandGeoJson)));
+        var first = new OsmLandDataProvider(
+            new HttpClient(firstHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path));
+        var bounds = new GeographicBounds(-10, 10, -10, 10);
+        Assert.Equal(LandDataStatus.Available, (await first.AcquireAsync(bounds)).Status);
+
+        // Earlier releases stored the cache as text with a UTF-8 preamble.
+        var cachePath = Assert.Single(Directory.EnumerateFiles(directory.Path, "*.geojson"));
+        await File.WriteAllTextAsync(cachePath, LandGeoJson, Encoding.UTF8);
+        Assert.Equal(Encoding.UTF8.Preamble.ToArray(), File.ReadAllBytes(cachePath)[..3]);
+        var secondHandler = new RecordingHttpHandler((_, _, _) =>
+            Task.FromResult(new HttpResponseMessage(HttpStatusCode.ServiceUnavailable)));
+        var second = new OsmLandDataProvider(
+            new HttpClient(secondHandler),
+            new OsmLandDataOptions(new Uri("https://land.example.test/geometry"), directory.Path));
+
+        var result = await second.AcquireAsync(bounds);
+
+        Assert.Equal(LandDataStatus.Available, result.Status);
+        Assert.True(result.Geometry!.Contains(new Coordinate(0, 0)));
+        Assert.Equal(0, secondHandler.RequestCount);
+    }
+
     [Fact]
     public async Task Disk_cache_evicts_oldest_corridor_within_configured_bounds()
     {
@@ -215,7 +434,7 @@ public sealed class OsmLandDataProviderTests
     [Fact]
     public void Geometry_index_respects_polygon_holes_and_narrow_crossings()
     {
-        var payload = GeoJsonLandParser.Parse("""
+        var payload = GeoJsonLandParser.Parse(Encoding.UTF8.GetBytes("""
             {
               "type": "Polygon",
               "coordinates": [
@@ -223,7 +442,7 @@ public sealed class OsmLandDataProviderTests
                 [[-1,-1],[-1,1],[1,1],[1,-1],[-1,-1]]
               ]
             }
-            """);
+            """));
         var index = new LandGeometryIndex(payload.Geometries, 0.25);
 
         Assert.False(index.Contains(new Coordinate(0, 0)));
@@ -239,12 +458,12 @@ public sealed class OsmLandDataProviderTests
     [Fact]
     public void Equivalent_antimeridian_longitudes_do_not_divide_by_zero()
     {
-        var payload = GeoJsonLandParser.Parse("""
+        var payload = GeoJsonLandParser.Parse(Encoding.UTF8.GetBytes("""
             {
               "type": "Polygon",
               "coordinates": [[[179,-1],[180,-1],[180,1],[179,1],[179,-1]]]
             }
-            """);
+            """));
         var index = new LandGeometryIndex(payload.Geometries, 0.25);
 
         Assert.True(index.IntersectsSegment(
@@ -255,12 +474,12 @@ public sealed class OsmLandDataProviderTests
     [Fact]
     public void Dateline_crossing_polygon_stays_narrow_and_matches_both_longitude_aliases()
     {
-        var payload = GeoJsonLandParser.Parse("""
+        var payload = GeoJsonLandParser.Parse(Encoding.UTF8.GetBytes("""
             {
               "type": "Polygon",
               "coordinates": [[[179,-1],[-179,-1],[-179,1],[179,1],[179,-1]]]
             }
-            """);
+            """));
         var index = new LandGeometryIndex(payload.Geometries, 0.25);
 
         Assert.True(index.Contains(new Coordinate(0, 180)));
@@ -271,6 +490,27 @@ public sealed class OsmLandDataProviderTests
             new Coordinate(0, -178)));
     }
 
+    [Fact]
+    public void Parser_reads_streamed_and_byte_order_marked_utf8_alike()
+    {
+        var json = Encoding.UTF8.GetBytes("""
+            {
+              "type": "Polygon",
+              "coordinates": [[[0,0],[1,0],[1,1],[0,1],[0,0]]],
+              "attribution": "OpenStreetMap contributors"
+            }
+            """);
+        byte[] markedJson = [.. Encoding.UTF8.Preamble, .. json];
+        using var stream = new MemoryStream(json);
+
+        var streamed = GeoJsonLandParser.Parse(stream);
+        var marked = GeoJsonLandParser.Parse(markedJson);
+
+        Assert.Equal("OpenStreetMap contributors", streamed.Attribution);
+        Assert.Equal(streamed.Attribution, marked.Attribution);
+        Assert.True(streamed.Geometries.Single().EqualsExact(marked.Geometries.Single()));
+    }
+
     private static HttpResponseMessage GeoJsonResponse(string json) =>
         new(HttpStatusCode.OK)
         {
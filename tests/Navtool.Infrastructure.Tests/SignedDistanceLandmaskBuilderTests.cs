@@ -138,6 +138,33 @@ public sealed class SignedDistanceLandmaskBuilderTests
                 Metadata));
     }
 
+    [Fact]
+    public void BuildHonorsAPreCancelledToken()
+    {
+        using var cancellation = new CancellationTokenSource();
+        cancellation.Cancel();
+
+        Assert.Throws<OperationCanceledException>(() =>
+            SignedDistanceLandmaskBuilder.Build(
+                Island(),
+                new GeographicBounds(-1, 1, 9, 11),
+                resolutionNauticalMiles: 6,
+                Metadata,
+                cancellationToken: cancellation.Token));
+    }
+
+    [Fact]
+    public void ParallelRowsSurfaceAGeometryFaultAsItsOriginalType()
+    {
+        var exception = Assert.Throws<ArgumentOutOfRangeException>(() =>
+            SignedDistanceLandmaskBuilder.ForEachRow(
+                8,
+                CancellationToken.None,
+                row => _ = new Navtool.Core.Coordinate(row == 5 ? 91 : 0, 0)));
+
+        Assert.Equal("latitude", exception.ParamName);
+    }
+
     [Fact]
     public void BuildReportsOpenOceanWhenNoLandIsNearby()
     {